@@ -1,8 +1,9 @@
 import socket
-from typing import Optional
+from logging import DEBUG
+from typing import List, Optional, Tuple
 from .NetworkComponent import NetworkComponent
 from .MessageRegistry import MessageType, MessageRegistry
-from .MessageConverter import MessageConverter
+from .MessageBuffer import MessageBuffer
 from .NetworkConfig import NetworkConfig
 
 class BasicClient(NetworkComponent):
@@ -13,6 +14,7 @@ class BasicClient(NetworkComponent):
         super().__init__()
         self.init_flag = False
         self.socket = None
+        self.buffer = None
         self.ip = None
         self.port = None
 
@@ -20,7 +22,11 @@ class BasicClient(NetworkComponent):
         """Connect to server at specified IP and port. Returns True if successful."""
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._set_buffer_sizes(self.socket)
             self.socket.connect((ip, port))
+            self.socket.settimeout(5.0)
+            self.buffer = MessageBuffer()
             self.ip = ip
             self.port = port
             self.logger.info(f"Connection with {ip}:{port}")
@@ -40,6 +46,7 @@ class BasicClient(NetworkComponent):
                 return False
         self.init_flag = False
         self.socket = None
+        self.buffer = None
         self.ip = None
         self.port = None
         self.logger.info("Connection closed")
@@ -54,28 +61,77 @@ class BasicClient(NetworkComponent):
             return self.get_message()
         return None
 
+    def send_batch(self, messages: List[Tuple[MessageType, bytes]]) -> Optional[list]:
+        """Send several messages to server and wait for their responses. Returns responses or None on error.
+
+        Messages are sent in groups of up to SEND_BATCH_SIZE with a single system call per group.
+        A timeout or disconnect while waiting for a response aborts the batch.
+        """
+        if not self.init_flag:
+            self.logger.error("Not connected to server")
+            return None
+        responses = []
+        for start in range(0, len(messages), NetworkConfig.SEND_BATCH_SIZE):
+            batch = messages[start:start + NetworkConfig.SEND_BATCH_SIZE]
+            if not self._send_messages(self.socket, batch):
+                return None
+            for _ in batch:
+                message = self._receive_message()
+                if message is None:
+                    return None
+                responses.append(self._process_message(*message))
+        return responses
+
+    def send_data_nowait(self, message_type: MessageType, data: bytes = b"") -> bool:
+        """Send data to server without waiting for the response. Returns True if successful.
+
+        Several requests may be sent before reading their responses, in order, with get_message.
+        """
+        if not self.init_flag:
+            self.logger.error("Not connected to server")
+            return False
+        return self._send_message(self.socket, message_type, data)
+
     def get_message(self) -> Optional[object]:
         """Receive and process next message from server. Returns None on error or timeout."""
         if not self.init_flag:
             return None
-        self.socket.settimeout(5.0)
+        message = self._receive_message()
+        if message is None:
+            return None
+        return self._process_message(*message)
+
+    def _receive_message(self) -> Optional[Tuple[MessageType, bytes]]:
+        """Receive next message from server. Returns None on error, timeout or disconnect."""
         try:
-            raw_data = self.socket.recv(NetworkConfig.HEADER_SIZE + NetworkConfig.MAX_LENGTH)
-            if not raw_data:
-                self.logger.info("Server disconnected")
-                return None
-            msg_type, data = MessageConverter.decode_message(raw_data)
+            message = self.buffer.next_message()
+            while message is None:
+                if not self.buffer.recv_from(self.socket):
+                    self.logger.info("Server disconnected")
+                    return None
+                message = self.buffer.next_message()
+            msg_type, data = message
             if msg_type is None:
-                self.logger.warning("Invalid message received")
+                self.logger.warning("Invalid message received, closing connection")
+                self.close()
                 return None
-            self.logger.info(f"Received data from {self.ip}:{self.port} - type: {msg_type}, data: {data[:50]}")
-            return self.registry.process(msg_type, data)
+            if self.logger.isEnabledFor(DEBUG):
+                self.logger.debug("Received data from %s:%s - type: %s, data: %s", self.ip, self.port, msg_type, data[:50])
+            return message
         except socket.timeout:
             self.logger.warning("Timeout waiting for message")
             return None
         except Exception as e:
             self.logger.error(f"Error getting message: {e}")
             return None
+
+    def _process_message(self, msg_type: MessageType, data: bytes) -> Optional[object]:
+        """Pass a received message to its handler. Returns None on error."""
+        try:
+            return self.registry.process(msg_type, data)
+        except Exception as e:
+            self.logger.error(f"Error processing message: {e}")
+            return None
     
     @MessageRegistry.handler("CHECK")
     def _check(self, data: bytes):
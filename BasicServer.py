@@ -1,10 +1,9 @@
 import threading
 import socket
-from concurrent.futures import ThreadPoolExecutor
-from .MessageRegistry import MessageRegistry, MessageType
-from .MessageConverter import MessageConverter
+from collections import deque
+from .MessageRegistry import MessageRegistry
 from .NetworkComponent import NetworkComponent
-from .NetworkConfig import NetworkConfig
+from .ServerWorker import ServerWorker
 
 class BasicServer(NetworkComponent):
     """Server implementation for handling multiple client connections."""
@@ -13,30 +12,46 @@ class BasicServer(NetworkComponent):
         """Initialize server with empty connection state and thread management."""
         super().__init__()
         self.init_flag = False
-        self.socket = None
+        self.workers = []
         self.stop_clients_thread_flag = threading.Event()
-        self.listen_clients_multithread = None
-        self.clients_thread = None
-        self.active_futures = []
-        self.futures_lock = threading.Lock()
+        self.max_clients = 1
+        self._clients_lock = threading.Lock()
+        self._client_count = 0
+        self._waiting_clients = deque()
 
-    def open(self, port: int, ip: str = '0.0.0.0', max_clients: int = 1):
-        """Start server on specified port and IP. Returns True if successful."""
+    def open(self, port: int, ip: str = '0.0.0.0', max_clients: int = 1, workers: int = 1):
+        """Start server on specified port and IP. Returns True if successful.
+
+        At most max_clients clients are served at once; further connections are accepted and
+        wait, unread, until a served client disconnects. With more than one worker, each worker
+        gets its own SO_REUSEPORT listening socket and event loop thread, the kernel balances
+        connections between them and max_clients limits the clients of all workers together.
+        """
         try:
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            self.socket.bind((ip, port))
-            self.socket.listen(max_clients)
+            self.max_clients = max_clients
+            self._client_count = 0
+            reuse_port = workers > 1
+            for _ in range(workers):
+                listen_socket = self._create_listen_socket(ip, port, max_clients, reuse_port)
+                try:
+                    self.workers.append(ServerWorker(self, listen_socket))
+                except Exception:
+                    listen_socket.close()
+                    raise
+                port = listen_socket.getsockname()[1]
             self.stop_clients_thread_flag.clear()
-            self.listen_clients_multithread = ThreadPoolExecutor(max_workers=max_clients)
-            self.clients_thread = threading.Thread(target=self.get_clients_thread)
-            self.clients_thread.daemon = True
-            self.clients_thread.start()
+            for worker in self.workers:
+                worker.thread.start()
             self.init_flag = True
             self.logger.info(f"Server started on {ip}:{port}")
             return True
         except Exception as e:
             self.logger.error(f"Failed to start server: {e}")
+            for worker in self.workers:
+                worker.socket.close()
+                worker.selector.close()
+                worker.close_wakeup()
+            self.workers = []
             return False
 
     def close(self):
@@ -44,79 +59,69 @@ class BasicServer(NetworkComponent):
         try:
             if self.init_flag:
                 self.stop_clients_thread_flag.set()
-                if self.socket:
-                    self.socket.close()
-                if self.listen_clients_multithread:
-                    self.logger.info(f"Active futures before shutdown: {len([f for f in self.active_futures if not f.done()])}")
-                    self.listen_clients_multithread.shutdown(wait=True)
-                if self.clients_thread:
-                    self.clients_thread.join()
+                for worker in self.workers:
+                    worker.wake()
+                for worker in self.workers:
+                    worker.thread.join()
+                    worker.socket.close()
+                self._close_waiting_clients()
                 self.init_flag = False
                 self.logger.info("Server closed")
         except Exception as e:
             self.logger.error(f"Error closing server: {e}")
         finally:
-            self.socket = None
-            self.listen_clients_multithread = None
-            self.clients_thread = None
-            self.active_futures = []
+            for worker in self.workers:
+                worker.close_wakeup()
+            self.workers = []
+
+    def _reserve_client_slot(self, worker: ServerWorker, connection) -> bool:
+        """Take a client slot for a new connection. Returns False if it has to wait for one."""
+        with self._clients_lock:
+            if self._client_count < self.max_clients:
+                self._client_count += 1
+                return True
+            self._waiting_clients.append((worker, connection))
+            return False
 
-    def get_clients_thread(self):
-        """Main thread for accepting new client connections."""
-        while not self.stop_clients_thread_flag.is_set():
-            try:
-                self.socket.settimeout(1.0)
-                client, addr = self.socket.accept()
-                self.logger.info(f"Connection from {addr}")
-                future = self.listen_clients_multithread.submit(self.client_read_thread, client, addr)
-                with self.futures_lock:
-                    self.active_futures.append(future)
-                    self.active_futures = [f for f in self.active_futures if not f.done()]
-                self.logger.debug(f"Submitted task for {addr}, active futures: {len([f for f in self.active_futures if not f.done()])}")
-            except socket.timeout:
-                continue
-            except Exception as e:
-                if not self.stop_clients_thread_flag.is_set():
-                    self.logger.error(f"Error accepting connection: {e}")
-                break
+    def _release_client_slot(self):
+        """Pass the slot of a closed client to the longest waiting connection, if any."""
+        with self._clients_lock:
+            if not self._waiting_clients:
+                self._client_count -= 1
+                return
+            worker, connection = self._waiting_clients.popleft()
+        worker.admit_client(connection)
 
-    def client_read_thread(self, client, addr):
-        """Thread for handling individual client communication."""
+    def _close_waiting_clients(self):
+        """Close connections still waiting for a client slot after the workers have stopped."""
+        with self._clients_lock:
+            waiting = [connection for _, connection in self._waiting_clients]
+            self._waiting_clients.clear()
+            self._client_count = 0
+        for worker in self.workers:
+            waiting.extend(worker.admitted_clients)
+            worker.admitted_clients.clear()
+        for connection in waiting:
+            connection.socket.close()
+
+    def _create_listen_socket(self, ip: str, port: int, backlog: int, reuse_port: bool) -> socket.socket:
+        """Create a bound, listening, non-blocking socket whose accepted sockets inherit its buffer sizes."""
+        listen_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         try:
-            while not self.stop_clients_thread_flag.is_set():
-                try:
-                    raw_data = client.recv(NetworkConfig.HEADER_SIZE + NetworkConfig.MAX_LENGTH)
-                    if not raw_data:
-                        self.logger.info(f"Client {addr} disconnected")
-                        break
-                    self.logger.debug(f"Received data: {raw_data}")
-                    msg_type, data = MessageConverter.decode_message(raw_data)
-                    if msg_type is None:
-                        self.logger.warning(f"Invalid message from {addr}")
-                        self._send_message(client, MessageType.ERROR)
-                        break
-                    self.logger.info(f"Message from {addr} - type: {msg_type}, data: {data[:50]}")
-                    response = self.registry.process(msg_type, data)
-                    self.logger.debug(f"Response: {response}")
-                    if response is not None:
-                        self._send_message(client, msg_type, response)
-                    else:
-                        self._send_message(client, MessageType.ERROR, b"Invalid message")
-                except socket.timeout:
-                    message = "Timeout waiting for message"
-                    self.logger.warning(f"{message} from {addr}")
-                    self._send_message(client, MessageType.ERROR, message.encode())
-                    break
-                except Exception as e:
-                    message = "Failed processing connection"
-                    self.logger.error(f"{message} {addr}: {e}")
-                    self._send_message(client, MessageType.ERROR, f"{message}: {e}".encode())
-                    break
-        finally:
-            try:
-                client.close()
-            except:
-                pass
+            listen_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if reuse_port:
+                if not hasattr(socket, 'SO_REUSEPORT'):
+                    raise ValueError("Multiple workers require SO_REUSEPORT support")
+                listen_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            listen_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._set_buffer_sizes(listen_socket)
+            listen_socket.bind((ip, port))
+            listen_socket.listen(backlog)
+            listen_socket.setblocking(False)
+            return listen_socket
+        except Exception:
+            listen_socket.close()
+            raise
     
     @MessageRegistry.handler("CHECK")
     def _check(self, data: bytes):
@@ -126,4 +131,4 @@ class BasicServer(NetworkComponent):
     @MessageRegistry.handler("ERROR")
     def _error(self, data: bytes):
         """Handle ERROR message type by logging the error."""
-        self._handle_error(data)
\ No newline at end of file
+        self._handle_error(data)
@@ -0,0 +1,43 @@
+import socket
+from collections import deque
+from itertools import islice
+from typing import List, Tuple
+from .MessageRegistry import MessageType
+from .MessageConverter import MessageConverter
+from .MessageBuffer import MessageBuffer
+from .NetworkConfig import NetworkConfig
+
+
+class ClientConnection:
+    """State of one non-blocking client connection served by a ServerWorker."""
+    __slots__ = ('socket', 'addr', 'buffer', 'outgoing', 'closing')
+
+    def __init__(self, sock: socket.socket, addr):
+        """Initialize connection state for an accepted client socket."""
+        self.socket = sock
+        self.addr = addr
+        self.buffer = MessageBuffer()
+        self.outgoing = deque()
+        self.closing = False
+
+    def queue_messages(self, messages: List[Tuple[MessageType, bytes]]) -> None:
+        """Encode messages into the outgoing queue without sending them."""
+        self.outgoing.extend(MessageConverter.encode_buffers(messages))
+
+    def flush(self) -> None:
+        """Send as much of the outgoing queue as the socket accepts without blocking."""
+        outgoing = self.outgoing
+        try:
+            while outgoing:
+                buffers = list(islice(outgoing, 2 * NetworkConfig.SEND_BATCH_SIZE))
+                sent = MessageConverter.send_buffers(self.socket, buffers)
+                while outgoing and sent >= len(outgoing[0]):
+                    sent -= len(outgoing.popleft())
+                if sent:
+                    outgoing[0] = memoryview(outgoing[0])[sent:]
+        except BlockingIOError:
+            pass
+
+    def backlogged(self) -> bool:
+        """Return True if so much output is queued that reading should pause."""
+        return len(self.outgoing) > 2 * NetworkConfig.SEND_BATCH_SIZE
@@ -0,0 +1,43 @@
+import socket
+from typing import Optional, Tuple
+from .MessageRegistry import MessageType
+from .MessageConverter import MessageConverter
+from .NetworkConfig import NetworkConfig
+
+
+class MessageBuffer:
+    """Receive buffer that reassembles length-prefixed messages from a stream socket."""
+
+    def __init__(self):
+        """Initialize an empty receive buffer large enough for several messages."""
+        self._buffer = bytearray(max(NetworkConfig.RECV_BUFFER_SIZE, NetworkConfig.HEADER_SIZE + NetworkConfig.MAX_LENGTH))
+        self._view = memoryview(self._buffer)
+        self._start = 0
+        self._end = 0
+
+    def recv_from(self, sock: socket.socket) -> int:
+        """Read available bytes from the socket into the buffer. Returns 0 if the connection was closed."""
+        if self._start:
+            remaining = self._end - self._start
+            if remaining:
+                self._view[:remaining] = self._view[self._start:self._end]
+            self._start = 0
+            self._end = remaining
+        count = sock.recv_into(self._view[self._end:])
+        self._end += count
+        return count
+
+    def next_message(self) -> Optional[Tuple[Optional[MessageType], bytes]]:
+        """Pop the next complete message. Returns None if incomplete, (None, b"") if invalid."""
+        start = self._start
+        if self._end - start < NetworkConfig.HEADER_SIZE:
+            return None
+        msg_type, length = MessageConverter.decode_header(self._view, start)
+        if msg_type is None:
+            return None, b""
+        data_start = start + NetworkConfig.HEADER_SIZE
+        end = data_start + length
+        if self._end < end:
+            return None
+        self._start = end
+        return msg_type, bytes(self._view[data_start:end])
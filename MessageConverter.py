@@ -1,30 +1,60 @@
+import socket
+import struct
 from .NetworkConfig import NetworkConfig
 from .MessageRegistry import MessageType
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
+
+_FIELD_FORMATS = {1: 'B', 2: 'H', 4: 'I', 8: 'Q'}
+_HEADER = struct.Struct('>' + _FIELD_FORMATS[NetworkConfig.TYPE_SIZE] + _FIELD_FORMATS[NetworkConfig.LENGTH_SIZE])
+_HAS_SENDMSG = hasattr(socket.socket, 'sendmsg')
 
 class MessageConverter:
     """Static utility for encoding and decoding network messages."""
     
+    @staticmethod
+    def encode_header(msg_type: MessageType, length: int) -> bytes:
+        """Encode message type and data length into a message header."""
+        if length > NetworkConfig.MAX_LENGTH:
+            raise ValueError(f"Data length {length} exceeds maximum of {NetworkConfig.MAX_LENGTH} bytes")
+        return _HEADER.pack(msg_type.value, length)
+
     @staticmethod
     def encode_message(msg_type: MessageType, data: bytes = b"") -> bytes:
-        """Encode message type and data into bytes for network transmission."""
-        if len(data) > NetworkConfig.MAX_LENGTH:
-            raise ValueError(f"Data length {len(data)} exceeds maximum of {NetworkConfig.MAX_LENGTH} bytes")
-        return msg_type.value.to_bytes(1, 'big') + data
+        """Encode message type, data length and data into bytes for network transmission."""
+        return MessageConverter.encode_header(msg_type, len(data)) + data
+
+    @staticmethod
+    def encode_buffers(messages: List[Tuple[MessageType, bytes]]) -> List[bytes]:
+        """Encode messages into a list of header and data buffers for a scatter-gather send."""
+        buffers = []
+        for message_type, data in messages:
+            buffers.append(MessageConverter.encode_header(message_type, len(data)))
+            if data:
+                buffers.append(data)
+        return buffers
+
+    @staticmethod
+    def send_buffers(sock: socket.socket, buffers: List[bytes]) -> int:
+        """Send buffers with one system call, scatter-gather where the platform supports it. Returns bytes sent."""
+        if _HAS_SENDMSG:
+            return sock.sendmsg(buffers)
+        return sock.send(b"".join(buffers))
+
+    @staticmethod
+    def decode_header(header: bytes, offset: int = 0) -> Tuple[Optional[MessageType], int]:
+        """Decode message header at offset into message type and data length. Returns (None, 0) on error."""
+        if not header or len(header) < offset + NetworkConfig.HEADER_SIZE:
+            return None, 0
+        type_value, length = _HEADER.unpack_from(header, offset)
+        msg_type = MessageType.get_by_value(type_value)
+        if msg_type is None or length > NetworkConfig.MAX_LENGTH:
+            return None, 0
+        return msg_type, length
 
     @staticmethod
     def decode_message(raw_data: bytes) -> Tuple[Optional[MessageType], bytes]:
-        """Decode raw bytes into message type and data. Returns (None, b"") on error."""
-        if not raw_data or len(raw_data) < NetworkConfig.HEADER_SIZE:
+        """Decode a complete raw message into message type and data. Returns (None, b"") on error."""
+        msg_type, length = MessageConverter.decode_header(raw_data)
+        if msg_type is None or len(raw_data) < NetworkConfig.HEADER_SIZE + length:
             return None, b""
-        try:
-            msg_type = MessageType.get_by_value(int.from_bytes(raw_data[0:NetworkConfig.HEADER_SIZE], 'big'))
-            if msg_type is None:
-                return None, b""
-            if len(raw_data) > NetworkConfig.HEADER_SIZE:
-                data = raw_data[NetworkConfig.HEADER_SIZE:]
-            else:
-                data = b""
-            return msg_type, data
-        except (ValueError, IndexError):
-            return None, b""
\ No newline at end of file
+        return msg_type, raw_data[NetworkConfig.HEADER_SIZE:NetworkConfig.HEADER_SIZE + length]
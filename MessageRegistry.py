@@ -6,6 +6,7 @@ from threading import Lock
 class MessageType:
     """Class that emulates Enum for dynamically adding message types."""
     _members: dict = {}
+    _values: dict = {}
     _lock = Lock()
 
     def __init__(self, name: str, value: int):
@@ -21,6 +22,9 @@ class MessageType:
     @classmethod
     def register(cls, name: str) -> 'MessageType':
         """Registers a new message type or returns an existing one."""
+        message_type = cls._members.get(name)
+        if message_type is not None:
+            return message_type
         with cls._lock:
             if not name.isidentifier():
                 raise ValueError(f"'{name}' is not a valid identifier")
@@ -28,8 +32,9 @@ class MessageType:
                 return cls._members[name]
             value = len(cls._members)
             message_type = MessageType(name, value)
-            cls._members[name] = message_type
+            cls._values[value] = message_type
             setattr(cls, name, message_type)
+            cls._members[name] = message_type
             return message_type
 
     @classmethod
@@ -40,7 +45,7 @@ class MessageType:
     @classmethod
     def get_by_value(cls, value: int) -> 'MessageType':
         """Gets the message type by value."""
-        return next((message_type for message_type in cls._members.values() if message_type.value == value), None)
+        return cls._values.get(value)
 
     @classmethod
     def members(cls) -> dict:
@@ -48,10 +53,63 @@ class MessageType:
         return cls._members.copy()
 
 
+# Built-in message types, registered up front so they exist without importing client or server
+MessageType.register("CHECK")
+MessageType.register("ERROR")
+
+
+class _HandlerDict(dict):
+    """Dict of handlers by message type that mirrors every change into a list indexed by type value."""
+    def __init__(self):
+        super().__init__()
+        self.by_value: list = []
+
+    def __setitem__(self, message_type: MessageType, handler: Callable):
+        super().__setitem__(message_type, handler)
+        missing = message_type.value + 1 - len(self.by_value)
+        if missing > 0:
+            self.by_value.extend([None] * missing)
+        self.by_value[message_type.value] = handler
+
+    def __delitem__(self, message_type: MessageType):
+        super().__delitem__(message_type)
+        self.by_value[message_type.value] = None
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def update(self, *args, **kwargs):
+        for message_type, handler in dict(*args, **kwargs).items():
+            self[message_type] = handler
+
+    def setdefault(self, message_type: MessageType, handler: Callable = None):
+        if message_type not in self:
+            self[message_type] = handler
+        return self[message_type]
+
+    def pop(self, message_type: MessageType, *default):
+        if message_type not in self:
+            return super().pop(message_type, *default)
+        handler = self[message_type]
+        del self[message_type]
+        return handler
+
+    def popitem(self):
+        message_type, handler = super().popitem()
+        self.by_value[message_type.value] = None
+        return message_type, handler
+
+    def clear(self):
+        super().clear()
+        self.by_value.clear()
+
+
 class MessageRegistry:
     """Class for managing message handlers."""
     def __init__(self):
-        self.handlers: dict[MessageType, Callable] = {}
+        self.handlers: dict[MessageType, Callable] = _HandlerDict()
+        self._handlers_by_value: list = self.handlers.by_value
 
     @staticmethod
     def handler(name: Union[str]):
@@ -80,7 +138,10 @@ class MessageRegistry:
             message_type = MessageType.get(message_type)
         if not message_type:
             raise ValueError(f"Unknown message type: {message_type}")
-        handler = self.handlers.get(message_type)
+        try:
+            handler = self._handlers_by_value[message_type.value]
+        except IndexError:
+            handler = None
         if not handler:
             raise ValueError(f"No handler for message type: {message_type}")
         return handler(*args, **kwargs)
@@ -1,38 +1,68 @@
 import socket
+from typing import List, Tuple
 from logging import DEBUG, getLogger
 from .MessageRegistry import MessageRegistry, MessageType
 from .MessageConverter import MessageConverter
+from .NetworkConfig import NetworkConfig
 
 
 class NetworkComponent:
     """Base class for network communication components (client and server)."""
+    _handler_functions: list = []
+
+    def __init_subclass__(cls, **kwargs):
+        """Collect functions decorated with @MessageRegistry.handler once per class."""
+        super().__init_subclass__(**kwargs)
+        cls._handler_functions = [
+            method
+            for klass in cls.__mro__[:-1]  # Exclude object
+            for method in klass.__dict__.values()
+            if hasattr(method, '_message_handler')
+        ]
     
     def __init__(self):
         """Initialize the network component with registry and logger."""
         self.registry = MessageRegistry()
-        self.logger = getLogger(self.__class__.__name__)
-        self.logger.setLevel(DEBUG)
+        self.logger = getLogger(f"BasicClientServer.{self.__class__.__name__}")
         self._initialize_handlers()
         self.logger.info(f"{self.__class__.__name__} initialized")
 
     def _initialize_handlers(self):
         """Register all message handlers decorated with @MessageRegistry.handler."""
-        for cls in self.__class__.__mro__[:-1]:  # Exclude object
-            for name, method in cls.__dict__.items():
-                if hasattr(method, '_message_handler'):
-                    self.registry.register_handler(method.__get__(self, self.__class__))
+        for method in self._handler_functions:
+            self.registry.register_handler(method.__get__(self, self.__class__))
     
+    @staticmethod
+    def _set_buffer_sizes(sock: socket.socket) -> None:
+        """Size the kernel buffers of the socket to NetworkConfig.SOCKET_BUFFER_SIZE."""
+        size = NetworkConfig.SOCKET_BUFFER_SIZE
+        if size:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, size)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, size)
+
     def _handle_error(self, data: bytes) -> None:
         """Log error messages received from the network."""
         self.logger.error(f"Error: {data}")
     
     def _send_message(self, sock: socket.socket, message_type: MessageType, data: bytes = b"") -> bool:
         """Send a message through the socket. Returns True if successful."""
+        return self._send_messages(sock, [(message_type, data)])
+
+    def _send_messages(self, sock: socket.socket, messages: List[Tuple[MessageType, bytes]]) -> bool:
+        """Send several messages through the socket in one system call. Returns True if successful."""
         try:
-            msg = MessageConverter.encode_message(message_type, data)
-            sock.send(msg)
-            self.logger.info(f"Sent message - type: {message_type}, data: {data[:50]}")
+            buffers = MessageConverter.encode_buffers(messages)
+            sent = MessageConverter.send_buffers(sock, buffers)
+            if sent < sum(map(len, buffers)):
+                sock.sendall(b"".join(buffers)[sent:])
+            self._log_sent_messages(messages)
             return True
         except Exception as e:
             self.logger.error(f"Failed to send message: {e}")
-            return False
\ No newline at end of file
+            return False
+
+    def _log_sent_messages(self, messages: List[Tuple[MessageType, bytes]]) -> None:
+        """Log every sent message at DEBUG level."""
+        if self.logger.isEnabledFor(DEBUG):
+            for message_type, data in messages:
+                self.logger.debug("Sent message - type: %s, data: %s", message_type, data[:50])
@@ -1,8 +1,26 @@
 class NetworkConfig:
     """Network configuration constants for message handling."""
     
-    # Size of message type header in bytes
-    HEADER_SIZE = 1
+    # Size of message type field in bytes
+    TYPE_SIZE = 1
+    
+    # Size of data length field in bytes (big-endian)
+    LENGTH_SIZE = 4
+    
+    # Size of message header (type + data length) in bytes
+    HEADER_SIZE = TYPE_SIZE + LENGTH_SIZE
     
     # Maximum length of message data in bytes
     MAX_LENGTH = 255
+    
+    # Size of per-connection receive buffer in bytes, rounded up to hold at least one full message
+    RECV_BUFFER_SIZE = 16384
+    
+    # Maximum number of responses sent to one client in a single system call
+    SEND_BATCH_SIZE = 100
+    
+    # Seconds a worker waits before accepting again after running out of file descriptors
+    ACCEPT_RETRY_DELAY = 0.1
+    
+    # Size of kernel send and receive buffers of each socket in bytes, None keeps the system default
+    SOCKET_BUFFER_SIZE = max(2 * (HEADER_SIZE + MAX_LENGTH), 65536)
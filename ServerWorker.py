@@ -0,0 +1,225 @@
+import errno
+import threading
+import selectors
+import socket
+import time
+from collections import deque
+from logging import DEBUG
+from .MessageRegistry import MessageType
+from .ClientConnection import ClientConnection
+from .NetworkConfig import NetworkConfig
+
+
+class ServerWorker:
+    """Event loop serving the clients of one listening socket of a BasicServer."""
+
+    def __init__(self, server, listen_socket: socket.socket):
+        """Initialize worker for a bound, listening, non-blocking socket.
+
+        Other threads hand connections over and stop the worker through wake.
+        """
+        self.server = server
+        self.logger = server.logger
+        self.process = server.registry.process
+        self.socket = listen_socket
+        self.wakeup_socket, self._wakeup_writer = socket.socketpair()
+        self.wakeup_socket.setblocking(False)
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.socket, selectors.EVENT_READ)
+        self.selector.register(self.wakeup_socket, selectors.EVENT_READ)
+        self.accepting = True
+        self.resume_at = None
+        self.active_clients = set()
+        self.admitted_clients = deque()
+        self.thread = threading.Thread(target=self.run)
+        self.thread.daemon = True
+
+    def run(self):
+        """Accept new client connections and process their messages until the server stops."""
+        stop_flag = self.server.stop_clients_thread_flag
+        try:
+            while not stop_flag.is_set():
+                timeout = None if self.resume_at is None else max(0, self.resume_at - time.monotonic())
+                for key, events in self.selector.select(timeout):
+                    connection = key.data
+                    if connection is not None:
+                        if events & selectors.EVENT_READ:
+                            self.client_read(connection)
+                        if events & selectors.EVENT_WRITE and connection in self.active_clients:
+                            self.client_write(connection)
+                    elif key.fileobj is self.socket:
+                        self.accept_clients()
+                    else:
+                        self.handle_wakeup()
+                if self.resume_at is not None and time.monotonic() >= self.resume_at:
+                    self.resume_accepting()
+        except Exception as e:
+            if not stop_flag.is_set():
+                self.logger.error(f"Error in server loop: {e}")
+        finally:
+            self.logger.info(f"Active clients before shutdown: {len(self.active_clients)}")
+            for connection in list(self.active_clients):
+                self.close_client(connection)
+            self.selector.close()
+
+    def wake(self):
+        """Wake the worker's event loop from another thread."""
+        try:
+            self._wakeup_writer.send(b"\0")
+        except OSError:
+            pass
+
+    def close_wakeup(self):
+        """Close the socket pair used to wake the worker."""
+        self.wakeup_socket.close()
+        self._wakeup_writer.close()
+
+    def handle_wakeup(self):
+        """Drain wakeup bytes and start serving the connections admitted by the server."""
+        try:
+            while self.wakeup_socket.recv(4096):
+                pass
+        except BlockingIOError:
+            pass
+        while self.admitted_clients and not self.server.stop_clients_thread_flag.is_set():
+            self.register_client(self.admitted_clients.popleft())
+
+    def admit_client(self, connection: ClientConnection):
+        """Hand a waiting connection to the worker once the server has a free client slot for it."""
+        self.admitted_clients.append(connection)
+        self.wake()
+
+    def accept_clients(self):
+        """Accept all pending client connections and start serving those within the server's limit.
+
+        Connections beyond the limit wait, unread, until another client disconnects. Accept errors
+        are logged and leave connected clients untouched; when the process runs out of file
+        descriptors, accepting pauses for ACCEPT_RETRY_DELAY or until one of this worker's
+        clients disconnects.
+        """
+        while True:
+            try:
+                client, addr = self.socket.accept()
+            except BlockingIOError:
+                return
+            except OSError as e:
+                self.logger.error(f"Error accepting connection: {e}")
+                if e.errno in (errno.EMFILE, errno.ENFILE):
+                    self.pause_accepting()
+                    self.resume_at = time.monotonic() + NetworkConfig.ACCEPT_RETRY_DELAY
+                return
+            client.setblocking(False)
+            client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.logger.info(f"Connection from {addr}")
+            connection = ClientConnection(client, addr)
+            if self.server._reserve_client_slot(self, connection):
+                self.register_client(connection)
+            else:
+                self.logger.debug(f"Client limit reached, {addr} waits for a free slot")
+
+    def register_client(self, connection: ClientConnection):
+        """Register a connection that holds a client slot with the selector."""
+        self.selector.register(connection.socket, selectors.EVENT_READ, connection)
+        self.active_clients.add(connection)
+        self.logger.debug(f"Registered {connection.addr}, active clients: {len(self.active_clients)}")
+
+    def pause_accepting(self):
+        """Stop watching the listening socket; new connections wait in its backlog."""
+        if self.accepting:
+            self.selector.unregister(self.socket)
+            self.accepting = False
+
+    def resume_accepting(self):
+        """Watch the listening socket again unless the server is stopping."""
+        self.resume_at = None
+        if not self.accepting and not self.server.stop_clients_thread_flag.is_set():
+            self.selector.register(self.socket, selectors.EVENT_READ)
+            self.accepting = True
+
+    def client_read(self, connection: ClientConnection):
+        """Read available data from a client and queue a response to every complete message.
+
+        Responses are queued in batches of up to SEND_BATCH_SIZE messages and sent without
+        waiting for the client to read them; the rest is sent when the socket becomes writable.
+        """
+        addr = connection.addr
+        buffer = connection.buffer
+        process = self.process
+        responses = []
+        try:
+            if not buffer.recv_from(connection.socket):
+                self.logger.info(f"Client {addr} disconnected")
+                self.close_client(connection)
+                return
+            debug = self.logger.debug if self.logger.isEnabledFor(DEBUG) else None
+            while (message := buffer.next_message()) is not None:
+                msg_type, data = message
+                if msg_type is None:
+                    self.logger.warning(f"Invalid message from {addr}")
+                    responses.append((MessageType.ERROR, b""))
+                    connection.closing = True
+                    break
+                if debug:
+                    debug("Message from %s - type: %s, data: %s", addr, msg_type, data[:50])
+                response = process(msg_type, data)
+                if debug:
+                    debug("Response: %s", response)
+                if response is None:
+                    responses.append((MessageType.ERROR, b"Invalid message"))
+                elif len(response) > NetworkConfig.MAX_LENGTH:
+                    self.logger.error(f"Response to {addr} exceeds maximum of {NetworkConfig.MAX_LENGTH} bytes")
+                    responses.append((MessageType.ERROR, b"Response too long"))
+                else:
+                    responses.append((msg_type, response))
+                if len(responses) >= NetworkConfig.SEND_BATCH_SIZE:
+                    self.send_messages(connection, responses)
+                    responses = []
+        except BlockingIOError:
+            pass
+        except Exception as e:
+            message = "Failed processing connection"
+            self.logger.error(f"{message} {addr}: {e}")
+            responses.append((MessageType.ERROR, f"{message}: {e}".encode()[:NetworkConfig.MAX_LENGTH]))
+            connection.closing = True
+        self.send_messages(connection, responses)
+
+    def client_write(self, connection: ClientConnection):
+        """Send queued responses once the client socket becomes writable."""
+        self.send_messages(connection, [])
+
+    def send_messages(self, connection: ClientConnection, messages):
+        """Queue messages for a client, send what the socket accepts and update its selector events."""
+        if connection not in self.active_clients:
+            return
+        try:
+            connection.queue_messages(messages)
+            connection.flush()
+        except Exception as e:
+            self.logger.error(f"Failed to send message to {connection.addr}: {e}")
+            self.close_client(connection)
+            return
+        self.server._log_sent_messages(messages)
+        if connection.closing and not connection.outgoing:
+            self.close_client(connection)
+            return
+        if connection.closing or connection.backlogged():
+            events = selectors.EVENT_WRITE
+        elif connection.outgoing:
+            events = selectors.EVENT_READ | selectors.EVENT_WRITE
+        else:
+            events = selectors.EVENT_READ
+        if self.selector.get_key(connection.socket).events != events:
+            self.selector.modify(connection.socket, events, connection)
+
+    def close_client(self, connection: ClientConnection):
+        """Unregister and close a client connection, release its slot and resume accepting new ones."""
+        if connection not in self.active_clients:
+            return
+        self.active_clients.discard(connection)
+        self.selector.unregister(connection.socket)
+        try:
+            connection.socket.close()
+        except:
+            pass
+        self.server._release_client_slot()
+        self.resume_accepting()